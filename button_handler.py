@@ -8,7 +8,7 @@
 
 This helper library simplifies the usage of buttons with CircuitPython,
 by detecting and differentiating button inputs,
-returning a set of the inputs and calling their corresponding functions.
+returning a tuple of the inputs and calling their corresponding functions.
 
 
 * Author(s): EGJ Moorington
@@ -23,7 +23,14 @@ Implementation Notes
 """
 
 # imports
+from array import array
+
 from keypad import Event, EventQueue
+from micropython import const
+
+_TICKS_PERIOD = const(1 << 29)
+_TICKS_MAX = const(_TICKS_PERIOD - 1)
+_TICKS_HALFPERIOD = const(_TICKS_PERIOD // 2)
 
 try:
     from supervisor import ticks_ms  # type: ignore
@@ -44,8 +51,10 @@ except ImportError:
 __version__ = "3.0.0"
 __repo__ = "https://github.com/EGJ-Moorington/CircuitPython_Button_Handler.git"
 
-_TICKS_PERIOD = 1 << 29
-_TICKS_MAX = _TICKS_PERIOD - 1
+_NO_INPUTS = ()
+
+_PRESSED = const(1)
+_HOLDING = const(2)
 
 
 def timestamp_diff(time1: int, time2: int) -> int:
@@ -64,6 +73,13 @@ def timestamp_diff(time1: int, time2: int) -> int:
 class ButtonInitConfig:
     """Holds configuration values to pass when a :class:`ButtonHandler` object is initialised."""
 
+    __slots__ = (
+        "enable_multi_press",
+        "long_press_threshold",
+        "max_multi_press",
+        "multi_press_interval",
+    )
+
     def __init__(
         self,
         enable_multi_press: bool = True,
@@ -118,18 +134,96 @@ class ButtonInitConfig:
         self.multi_press_interval = multi_press_interval
 
 
+class _ButtonStates:
+    """
+    .. caution:: Classes with a *leading underscore (_)* are meant for **internal use only**,
+        and using them may cause **unexpected behaviour**. Please refrain from using them.
+
+    Holds the state of one or more buttons in parallel arrays, indexed by button.
+    """
+
+    __slots__ = (
+        "flags",
+        "last_press_time",
+        "press_count",
+        "press_start_time",
+        "timing_changed",
+    )
+
+    def __init__(self, button_amount: int = 1) -> None:
+        """
+        :param int button_amount: The amount of buttons whose state to hold.
+
+        .. attribute:: flags
+            :type: bytearray
+
+            The pressed and holding flags of each button. Bit 0 (:const:`_PRESSED`) is set
+            while the button is pressed, and bit 1 (:const:`_HOLDING`) is set once the button
+            has been held down for at least the time specified
+            by :attr:`Button.long_press_threshold`.
+
+        .. attribute:: last_press_time
+            :type: array.array
+
+            The time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
+            at which the previous press of each button's multi-press began.
+            It is only meaningful while the button's :attr:`press_count` is bigger than 0.
+
+        .. attribute:: press_count
+            :type: array.array
+
+            The amount of times each button has been pressed since its last multi-press ended.
+
+        .. attribute:: press_start_time
+            :type: array.array
+
+            The time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
+            at which the last press of each button began.
+
+        .. attribute:: timing_changed
+            :type: bool
+            :value: False
+
+            Whether the :attr:`Button.long_press_threshold` or :attr:`Button.multi_press_interval`
+            of any of the buttons has changed since the buttons were last checked
+            by :meth:`ButtonHandler._handle_buttons`.
+        """
+        self.flags = bytearray(button_amount)
+        self.last_press_time = array("l", [0] * button_amount)
+        self.press_count = array("H", [0] * button_amount)
+        self.press_start_time = array("l", [ticks_ms()] * button_amount)
+        self.timing_changed = False
+
+
 class Button:
     """Contains information about a single button."""
 
+    __slots__ = (
+        "_button_number",
+        "enable_multi_press",
+        "_long_press_threshold",
+        "max_multi_press",
+        "_multi_press_interval",
+        "_index",
+        "_states",
+    )
+
     def __init__(
-        self, button_number: int = 0, config: ButtonInitConfig = ButtonInitConfig()
+        self,
+        button_number: int = 0,
+        config: ButtonInitConfig = None,
+        states: _ButtonStates = None,
     ) -> None:
         """
         :param int button_number: Sets :attr:`._button_number`
             (the number associated with the button).
         :param ButtonInitConfig config: The :class:`ButtonInitConfig` object used to initialise
             the button's settings (:attr:`.enable_multi_press`, :attr:`.long_press_threshold`,
-            :attr:`.max_multi_press` and :attr:`.multi_press_interval`).
+            :attr:`.max_multi_press` and :attr:`.multi_press_interval`). If it is not provided,
+            the default values of :class:`ButtonInitConfig` are used.
+        :param _ButtonStates states: Sets :attr:`._states` (the :class:`_ButtonStates` object
+            that stores the button's state at index *button_number*). If it is not provided,
+            the button stores its state in a :class:`_ButtonStates` object of its own.
         :raise ValueError: if *button_number* is smaller than 0.
 
         .. attribute:: enable_multi_press
@@ -141,13 +235,6 @@ class Button:
             :meth:`ButtonHandler.update` returns a short press :class:`ButtonInput`
             object immediately after a short press.
 
-        .. attribute:: long_press_threshold
-            :type: float
-            :value: config.long_press_threshold = 1000
-
-            The minimum length of a press to count as a long press,
-            and the time the button should be pressed before counting as being held down.
-
         .. attribute:: max_multi_press
             :type: int
             :value: config.max_multi_press = 2
@@ -156,13 +243,6 @@ class Button:
             :meth:`ButtonHandler.update` returns the appropiate multi-press :class:`ButtonInput`
             object immediaetly after the button has been pressed this many times.
 
-        .. attribute:: multi_press_interval
-            :type: float
-            :value: config.multi_press_interval = 175
-
-            The time frame from a button release within which
-            another release should occur to count as a multi-press.
-
         .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
             and accessing them may cause **unexpected behaviour**. Please consider accessing
             a *property* (if available) instead.
@@ -174,56 +254,49 @@ class Button:
             The index number associated with the button.
             *Consider using* :attr:`.button_number` *instead*.
 
-        .. attribute:: _is_holding
-            :type: bool
-            :value: False
-
-            Whether the button has been held down for at least the time specified
-            by :attr:`.long_press_threshold`. *Consider using* :attr:`.is_holding` *instead*.
-
-        .. attribute:: _is_pressed
-            :type: bool
-            :value: False
+        .. attribute:: _long_press_threshold
+            :type: float
+            :value: config.long_press_threshold = 1000
 
-            Whether the button is currently pressed.
-            *Consider using* :attr:`.is_pressed` *instead*.
+            The minimum length of a press to count as a long press.
+            *Consider using* :attr:`.long_press_threshold` *instead*.
 
-        .. attribute:: _last_press_time
-            :type: float | None
-            :value: None
+        .. attribute:: _multi_press_interval
+            :type: float
+            :value: config.multi_press_interval = 175
 
-            The time (in miliseconds, tracked by :meth:`supervisor.ticks_ms`) that has passed since
-            the start of the previous press of a multi-press. It is set to :type:`None`
-            after the time specified by :attr:`.multi_press_interval` has passed.
+            The time frame from a button release within which
+            another release should occur to count as a multi-press.
+            *Consider using* :attr:`.multi_press_interval` *instead*.
 
-        .. attribute:: _press_count
+        .. attribute:: _index
             :type: int
-            :value: 0
+            :value: button_number if states else 0
 
-            The amount of times the button has been pressed since the last
-            multi-press ended. It is set to 0 if the time set
-            by :attr:`.multi_press_interval` passes after a short press.
+            The index at which the button's state is stored in :attr:`._states`.
 
-        .. attribute:: _press_start_time
-            :type: float
-            :value: ticks_ms()
+        .. attribute:: _states
+            :type: _ButtonStates
+            :value: states if states else _ButtonStates()
 
-            The time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
-            at which the last button press began.
+            The :class:`_ButtonStates` object that stores the button's state.
         """
         if button_number < 0:
             raise ValueError("button_number must be non-negative.")
+        if config is None:
+            config = ButtonInitConfig()
         self._button_number = button_number
         self.enable_multi_press = config.enable_multi_press
-        self.long_press_threshold = config.long_press_threshold
+        self._long_press_threshold = config.long_press_threshold
         self.max_multi_press = config.max_multi_press
-        self.multi_press_interval = config.multi_press_interval
+        self._multi_press_interval = config.multi_press_interval
 
-        self._last_press_time = None
-        self._press_count = 0
-        self._press_start_time = ticks_ms()
-        self._is_holding = False
-        self._is_pressed = False
+        if states is None:
+            self._index = 0
+            self._states = _ButtonStates()
+        else:
+            self._index = button_number
+            self._states = states
 
     @property
     def button_number(self):
@@ -242,7 +315,7 @@ class Button:
 
         :type: bool
         """
-        return self._is_holding
+        return bool(self._states.flags[self._index] & _HOLDING)
 
     @property
     def is_pressed(self):
@@ -251,57 +324,153 @@ class Button:
 
         :type: bool
         """
-        return self._is_pressed
+        return bool(self._states.flags[self._index] & _PRESSED)
+
+    @property
+    def long_press_threshold(self):
+        """
+        The minimum length of a press to count as a long press,
+        and the time the button should be pressed before counting as being held down.
 
-    def _check_multi_press_timeout(self, current_time: int) -> Union[int, None]:
+        :type: float
+        :param float long_press_threshold: The new long press threshold of the button.
         """
-        .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
-            and calling them may cause **unexpected behaviour**. Please refrain from using them.
+        return self._long_press_threshold
 
-        Check whether a multi-press has ended.
-        If it has, return the amount of times the button was pressed in that multi-press.
+    @long_press_threshold.setter
+    def long_press_threshold(self, long_press_threshold: float) -> None:
+        self._long_press_threshold = long_press_threshold
+        self._states.timing_changed = True
 
-        :param int current_time: The current time, provided by :meth:`supervisor.ticks_ms`.
-        :return: The amount of times the button was pressed in a multi-press,
-            if a multi-press has ended.
-        :rtype: int or None
-        """
-        if (
-            self._press_count > 0
-            and not self._is_pressed
-            and timestamp_diff(current_time, self._last_press_time) > self.multi_press_interval
-        ):
-            press_count = self._press_count
-            self._last_press_time = None
-            self._press_count = 0
-            return press_count
-        return None
-
-    def _is_held(self, current_time: int) -> bool:
+    @property
+    def multi_press_interval(self):
+        """
+        The time frame from a button release within which
+        another release should occur to count as a multi-press.
+
+        :type: float
+        :param float multi_press_interval: The new multi-press interval of the button.
+        """
+        return self._multi_press_interval
+
+    @multi_press_interval.setter
+    def multi_press_interval(self, multi_press_interval: float) -> None:
+        self._multi_press_interval = multi_press_interval
+        self._states.timing_changed = True
+
+    @property
+    def _is_holding(self) -> bool:
+        """
+        .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
+            and accessing them may cause **unexpected behaviour**. Please consider accessing
+            a *property* (if available) instead.
+
+        Whether the button has been held down for at least the time specified
+        by :attr:`.long_press_threshold`. *Consider using* :attr:`.is_holding` *instead*.
+
+        :type: bool
+        """
+        return bool(self._states.flags[self._index] & _HOLDING)
+
+    @_is_holding.setter
+    def _is_holding(self, is_holding: bool) -> None:
+        self._set_flag(_HOLDING, is_holding)
+
+    @property
+    def _is_pressed(self) -> bool:
+        """
+        .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
+            and accessing them may cause **unexpected behaviour**. Please consider accessing
+            a *property* (if available) instead.
+
+        Whether the button is currently pressed.
+        *Consider using* :attr:`.is_pressed` *instead*.
+
+        :type: bool
+        """
+        return bool(self._states.flags[self._index] & _PRESSED)
+
+    @_is_pressed.setter
+    def _is_pressed(self, is_pressed: bool) -> None:
+        self._set_flag(_PRESSED, is_pressed)
+
+    @property
+    def _last_press_time(self) -> Union[int, None]:
+        """
+        .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
+            and accessing them may cause **unexpected behaviour**. Please refrain from using them.
+
+        The time (in miliseconds, tracked by :meth:`supervisor.ticks_ms`) at which
+        the previous press of a multi-press began. It is :type:`None`
+        while :attr:`._press_count` is 0. Values set to it are truncated to an :type:`int`.
+
+        :type: int | None
+        """
+        if not self._states.press_count[self._index]:
+            return None
+        return self._states.last_press_time[self._index]
+
+    @_last_press_time.setter
+    def _last_press_time(self, last_press_time: Union[float, None]) -> None:
+        self._states.last_press_time[self._index] = int(last_press_time or 0)
+
+    @property
+    def _press_count(self) -> int:
+        """
+        .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
+            and accessing them may cause **unexpected behaviour**. Please refrain from using them.
+
+        The amount of times the button has been pressed since the last
+        multi-press ended. It is set to 0 if the time set
+        by :attr:`.multi_press_interval` passes after a short press.
+
+        :type: int
+        """
+        return self._states.press_count[self._index]
+
+    @_press_count.setter
+    def _press_count(self, press_count: int) -> None:
+        self._states.press_count[self._index] = press_count
+
+    @property
+    def _press_start_time(self) -> int:
+        """
+        .. caution:: Attributes with a *leading underscore (_)* are meant for **internal use only**,
+            and accessing them may cause **unexpected behaviour**. Please refrain from using them.
+
+        The time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
+        at which the last button press began. Values set to it are truncated to an :type:`int`.
+
+        :type: int
+        """
+        return self._states.press_start_time[self._index]
+
+    @_press_start_time.setter
+    def _press_start_time(self, press_start_time: float) -> None:
+        self._states.press_start_time[self._index] = int(press_start_time)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
         """
         .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
             and calling them may cause **unexpected behaviour**. Please refrain from using them.
 
-        Check whether the button has been held down for at least
-        the time specified by :attr:`.long_press_threshold`.
+        Set or clear one of the button's flags in :attr:`_ButtonStates.flags`.
 
-        :param int current_time: The current time, provided by :meth:`supervisor.ticks_ms`.
-        :return: Whether the button just began being held down.
-        :rtype: bool
+        :param int flag: The flag to set or clear (:const:`_PRESSED` or :const:`_HOLDING`).
+        :param bool value: Whether to set the flag (True) or clear it (False).
         """
-        if (
-            not self._is_holding
-            and self._is_pressed
-            and timestamp_diff(current_time, self._press_start_time) >= self.long_press_threshold
-        ):
-            self._is_holding = True
-            return True
-        return False
+        flags = self._states.flags
+        if value:
+            flags[self._index] |= flag
+        else:
+            flags[self._index] &= ~flag
 
 
 class ButtonInput:
     """Defines a button's input's characteristics."""
 
+    __slots__ = ("_action", "_button_number", "_hash", "callback", "timestamp")
+
     SHORT_PRESS = 1
     DOUBLE_PRESS = 2
     HOLD = "H"
@@ -316,7 +485,7 @@ class ButtonInput:
     ) -> None:
         """
         :param InputAction action: Sets :attr:`action` (the action associated with the input).
-        :param int button_number: Sets :attr:`button_number`
+        :param int button_number: Sets :attr:`_button_number`
             (the number of the button associated with the input).
         :param Callable[[], None] callback: Sets :attr:`callback` (the callback associated
             with the input).
@@ -331,12 +500,6 @@ class ButtonInput:
             Available constants are :const:`SHORT_PRESS`, :const:`DOUBLE_PRESS`,
             :const:`HOLD` and :const:`LONG_PRESS`.
 
-        .. attribute:: button_number
-            :type: int
-            :value: button_number = 0
-
-            The index number of the button associated with the input.
-
         .. attribute:: callback
             :type: Callable[[], None]
             :value: callback = lambda: None
@@ -391,9 +554,23 @@ class ButtonInput:
             :value: action
 
             The action associated with the input. *Consider accessing* :attr:`action` *instead*.
+
+        .. attribute:: _button_number
+            :type: int
+            :value: button_number = 0
+
+            The index number of the button associated with the input.
+            *Consider accessing* :attr:`button_number` *instead*.
+
+        .. attribute:: _hash
+            :type: int
+            :value: hash((action, button_number))
+
+            The hash value of the input, returned by :meth:`__hash__`. It is updated
+            whenever :attr:`action` or :attr:`button_number` are set.
         """
+        self._button_number = button_number
         self.action = action
-        self.button_number = button_number
         self.callback = callback
         self.timestamp = timestamp
 
@@ -413,17 +590,29 @@ class ButtonInput:
 
     @action.setter
     def action(self, action: Union[int, str]):
-        if action in {ButtonInput.LONG_PRESS, ButtonInput.HOLD}:
-            self._action = action
-            return
-        try:
-            if not isinstance(action, int):
-                raise ValueError
-            if action < 1:
-                raise ValueError
-            self._action = action
-        except ValueError:
+        if isinstance(action, int):
+            is_valid = action > 0
+        else:
+            is_valid = action in _STRING_ACTIONS
+        if not is_valid:
             raise ValueError(f"Invalid action: {action}.")
+        self._action = action
+        self._hash = hash((action, self._button_number))
+
+    @property
+    def button_number(self):
+        """
+        The index number of the button associated with the input.
+
+        :type: int
+        :param int button_number: The index number of the button associated with the input.
+        """
+        return self._button_number
+
+    @button_number.setter
+    def button_number(self, button_number: int):
+        self._button_number = button_number
+        self._hash = hash((self._action, button_number))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -438,7 +627,7 @@ class ButtonInput:
         :rtype: bool
         """
         if isinstance(other, ButtonInput):
-            return self._action == other._action and self.button_number == other.button_number
+            return self._action == other._action and self._button_number == other._button_number
         return False
 
     def __hash__(self) -> int:
@@ -453,7 +642,7 @@ class ButtonInput:
         .. seealso:: :meth:`__eq__` - two :class:`ButtonInput` objects hash to the same value
             if they are equal.
         """
-        return hash((self.action, self.button_number))
+        return self._hash
 
     def __str__(self) -> str:
         """
@@ -467,6 +656,9 @@ class ButtonInput:
         return f"{self.action} on button {self.button_number}"
 
 
+_STRING_ACTIONS = (ButtonInput.HOLD, ButtonInput.LONG_PRESS)
+
+
 class ButtonHandler:
     """Handles different types of button presses."""
 
@@ -513,20 +705,74 @@ class ButtonHandler:
             :value: event_queue
 
             The :class:`keypad.EventQueue` object the handler should read events from.
+
+        .. attribute:: _hold_inputs
+            :type: list[ButtonInput]
+
+            The :class:`ButtonInput` objects returned when each button begins being held down.
+
+        .. attribute:: _long_press_inputs
+            :type: list[ButtonInput]
+
+            The :class:`ButtonInput` objects returned when each button is long pressed.
+
+        .. attribute:: _multi_press_inputs
+            :type: list[list[ButtonInput]]
+
+            The :class:`ButtonInput` objects returned when a multi-press of each button ends,
+            indexed by the amount of presses minus 1. They are created up to
+            :attr:`Button.max_multi_press` presses, and more are added if they are needed.
+
+        .. attribute:: _next_deadline
+            :type: int | None
+            :value: None
+
+            The earliest time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
+            at which a button could begin being held down or end a multi-press, or :type:`None`
+            if no button can. :meth:`.update` only checks the buttons once it is reached,
+            or once :attr:`_ButtonStates.timing_changed` is set.
+
+        .. attribute:: _short_press_inputs
+            :type: list[ButtonInput]
+
+            The :class:`ButtonInput` objects returned when each button is short pressed
+            with :attr:`Button.enable_multi_press` set to False.
+
+        .. attribute:: _states
+            :type: _ButtonStates
+            :value: _ButtonStates(button_amount)
+
+            The :class:`_ButtonStates` object that stores the state of every button,
+            indexed by :attr:`Button.button_number`.
         """
         if not isinstance(button_amount, int) or button_amount < 1:
             raise ValueError("button_amount must be bigger than 0.")
 
         self.callable_inputs = callable_inputs
 
-        self._buttons: list[Button] = []
-        for i in range(button_amount):  # Create a Button object for each button to handle
-            if config:
-                conf = config.get(i, ButtonInitConfig())
-            else:
-                conf = ButtonInitConfig()
-            self._buttons.append(Button(i, conf))
-
+        if config is None:
+            config = {}
+        self._states = _ButtonStates(button_amount)
+        # Create a Button object for each button to handle. Buttons without a config use defaults
+        self._buttons: list[Button] = [
+            Button(i, config.get(i), self._states) for i in range(button_amount)
+        ]
+
+        # Create the ButtonInput objects returned by update() beforehand
+        self._hold_inputs = [ButtonInput(ButtonInput.HOLD, i) for i in range(button_amount)]
+        self._long_press_inputs = [
+            ButtonInput(ButtonInput.LONG_PRESS, i) for i in range(button_amount)
+        ]
+        self._short_press_inputs = [
+            ButtonInput(ButtonInput.SHORT_PRESS, i) for i in range(button_amount)
+        ]
+        self._multi_press_inputs = [
+            [self._short_press_inputs[i]]
+            + [ButtonInput(j, i) for j in range(2, button.max_multi_press + 1)]
+            for i, button in enumerate(self._buttons)
+        ]
+
+        self._next_deadline = None
         self._event = Event()
         self._event_queue = event_queue
 
@@ -540,31 +786,56 @@ class ButtonHandler:
         """
         return self._buttons
 
-    def update(self) -> set[ButtonInput]:
+    def update(self) -> tuple[ButtonInput, ...]:
         """
         Check if any button ended a multi-press since the last time this method was called,
         process the next :class:`keypad.Event` in :attr:`_event_queue`, call all the relevant
-        callback functions and return a set of the detected :class:`ButtonInput`\\ s.
-
-        :return: Returns a set containing all of the detected :class:`ButtonInput`\\ s
-        :rtype: set[ButtonInput]
-        """
-        inputs = set()
+        callback functions and return a tuple of the detected :class:`ButtonInput`\\ s.
 
-        inputs.update(self._handle_buttons())
+        .. note:: The returned :class:`ButtonInput` objects are reused between calls,
+            and their :attr:`ButtonInput.timestamp` is updated every time they are detected.
+            An input detected more than once during the same call appears once per detection,
+            each time with the timestamp of that detection.
+            If no input is detected, a shared empty :class:`tuple` is returned.
 
-        event = self._event
+        :return: Returns a tuple containing all of the detected :class:`ButtonInput`\\ s
+        :rtype: tuple[ButtonInput, ...]
+        """
         event_queue = self._event_queue
-        while event_queue:
-            event_queue.get_into(event)
-            input_ = self._handle_event(event)
-            if input_:
-                inputs.add(input_)
+        next_deadline = self._next_deadline
+        # A changed threshold may move the deadline, so the buttons are checked again
+        deadline_reached = self._states.timing_changed or (
+            next_deadline is not None
+            and (ticks_ms() - next_deadline) & _TICKS_MAX < _TICKS_HALFPERIOD
+        )
+        if not deadline_reached and not event_queue:  # Nothing can be detected
+            return _NO_INPUTS
+
+        inputs = _NO_INPUTS
+        if deadline_reached:
+            current_time = ticks_ms()
+            inputs = self._handle_buttons(current_time)
+            for input_ in inputs:
+                input_.timestamp = current_time
+
+        # Drain every pending event in one pass, looking up what the loop needs only once
+        event = self._event
+        get_into = event_queue.get_into
+        handle_event = self._handle_event
+        while get_into(event):
+            input_ = handle_event(event)
+            if not input_:
+                continue
+            if input_ in inputs:  # Already detected during this call, so it can't be reused
+                input_ = ButtonInput(input_.action, input_.button_number)
+            input_.timestamp = event.timestamp
+            inputs += (input_,)
 
-        self._call_callbacks(inputs)
+        if inputs:
+            self._call_callbacks(inputs)
         return inputs
 
-    def _call_callbacks(self, inputs: set[ButtonInput]) -> None:
+    def _call_callbacks(self, inputs: tuple[ButtonInput, ...]) -> None:
         """
         .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
             and calling them may cause **unexpected behaviour**. Please refrain from using them.
@@ -572,7 +843,7 @@ class ButtonHandler:
         Call the callback function associated with every :class:`ButtonInput` object detected
         during execution of :meth:`.update`.
 
-        :param set[ButtonInput] inputs: A set containing every input
+        :param tuple[ButtonInput, ...] inputs: A tuple containing every input
             whose callback is to be called.
         """
         for input_ in inputs:
@@ -582,28 +853,63 @@ class ButtonHandler:
                 if callable_input == input_:
                     callable_input.callback()
 
-    def _handle_buttons(self) -> set[ButtonInput]:
+    def _handle_buttons(self, current_time: int) -> tuple[ButtonInput, ...]:
         """
         .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
             and calling them may cause **unexpected behaviour**. Please refrain from using them.
 
         Check if any button began being held down since the last time this mehod was called
-        and if any multi-press ended, and return every detected :class:`ButtonInput`.
-
-        :return: A set containing every detected :class:`ButtonInput`.
-        :rtype: set[ButtonInput]
-        """
-        inputs = set()
-        current_time = ticks_ms()
-        for button in self._buttons:
-            if button._is_held(current_time):
-                inputs.add(
-                    ButtonInput(ButtonInput.HOLD, button.button_number, timestamp=current_time)
-                )
-            else:
-                num = button._check_multi_press_timeout(current_time)
-                if num:
-                    inputs.add(ButtonInput(num, button.button_number, timestamp=current_time))
+        and if any multi-press ended, update :attr:`_next_deadline`
+        and return every detected :class:`ButtonInput`.
+        The :attr:`ButtonInput.timestamp` of the returned inputs is left for the caller to set.
+
+        :param int current_time: The current time, provided by :meth:`supervisor.ticks_ms`.
+        :return: A tuple containing every detected :class:`ButtonInput`,
+            or a shared empty :class:`tuple` if none was detected.
+        :rtype: tuple[ButtonInput, ...]
+        """
+        inputs = _NO_INPUTS
+        next_deadline = None
+        ticks_max = _TICKS_MAX
+        buttons = self._buttons
+        states = self._states
+        states.timing_changed = False
+        flags = states.flags
+        press_count = states.press_count
+        # Both checks are made inline, as this method runs whenever update() reaches _next_deadline
+        for i in range(len(buttons)):
+            button_flags = flags[i]
+            if button_flags & _PRESSED:  # Check whether the button began being held down
+                if button_flags & _HOLDING:
+                    continue
+                start_time = states.press_start_time[i]
+                long_press_threshold = buttons[i]._long_press_threshold
+                if (current_time - start_time) & ticks_max >= long_press_threshold:
+                    flags[i] = button_flags | _HOLDING
+                    inputs += (self._hold_inputs[i],)
+                    continue
+                if not long_press_threshold < _TICKS_HALFPERIOD:  # Too long to track, e.g. inf
+                    continue
+                deadline = start_time + int(long_press_threshold)
+            else:  # Check whether a multi-press ended
+                count = press_count[i]
+                if not count:  # Idle button
+                    continue
+                last_press_time = states.last_press_time[i]
+                multi_press_interval = buttons[i]._multi_press_interval
+                if (current_time - last_press_time) & ticks_max > multi_press_interval:
+                    press_count[i] = 0
+                    inputs += (self._multi_press_input(i, count),)
+                    continue
+                if not multi_press_interval < _TICKS_HALFPERIOD:  # Too long to track, e.g. inf
+                    continue
+                deadline = last_press_time + int(multi_press_interval)
+            deadline &= ticks_max
+            if (
+                next_deadline is None or (deadline - next_deadline) & ticks_max >= _TICKS_HALFPERIOD
+            ):  # This button's deadline comes first
+                next_deadline = deadline
+        self._next_deadline = next_deadline
         return inputs
 
     def _handle_event(self, event: Event) -> Union[ButtonInput, None]:
@@ -614,39 +920,73 @@ class ButtonHandler:
         Process a :class:`keypad.Event` and return a :class:`ButtonInput` based on it.
 
         :param keypad.Event event: The :class:`keypad.Event` object to process.
-        :return: The detected :class:`ButtonInput`, if any.
+        :return: The detected :class:`ButtonInput`, if any. Its :attr:`ButtonInput.timestamp`
+            is left for the caller to set.
         :rtype: ButtonInput or None
         """
-        button = self._buttons[event.key_number]
+        i = event.key_number
+        timestamp = event.timestamp
+        states = self._states
+        press_count = states.press_count
+        button = self._buttons[i]
         if event.pressed:  # Button just pressed
-            button._is_pressed = True
-            button._press_start_time = event.timestamp
-            button._last_press_time = event.timestamp
-            button._press_count += 1
+            states.flags[i] |= _PRESSED
+            states.press_start_time[i] = timestamp
+            states.last_press_time[i] = timestamp
+            press_count[i] += 1
+            self._update_deadline(timestamp, button._long_press_threshold)
 
         else:  # Button just released
-            button._is_pressed = False
-            if (
-                timestamp_diff(event.timestamp, button._press_start_time)
-                < button.long_press_threshold
-            ):  # Short press
-                if not button.enable_multi_press:
-                    input_ = ButtonInput(
-                        ButtonInput.SHORT_PRESS, event.key_number, timestamp=event.timestamp
-                    )
-                elif button._press_count == button.max_multi_press:
-                    input_ = ButtonInput(
-                        button.max_multi_press,
-                        event.key_number,
-                        timestamp=event.timestamp,
-                    )
-                else:  # More short presses could follow
-                    return None
-            else:
-                input_ = ButtonInput(
-                    ButtonInput.LONG_PRESS, event.key_number, timestamp=event.timestamp
-                )
-                button._is_holding = False
-            button._last_press_time = None
-            button._press_count = 0
+            states.flags[i] &= ~_PRESSED
+            duration = (timestamp - states.press_start_time[i]) & _TICKS_MAX
+            if duration >= button._long_press_threshold:  # Long press
+                input_ = self._long_press_inputs[i]
+                states.flags[i] &= ~_HOLDING
+            elif not button.enable_multi_press:  # Short press
+                input_ = self._short_press_inputs[i]
+            elif press_count[i] == button.max_multi_press:  # Multi-press of the maximum length
+                input_ = self._multi_press_input(i, button.max_multi_press)
+            else:  # More short presses could follow
+                self._update_deadline(states.last_press_time[i], button._multi_press_interval)
+                return None
+            press_count[i] = 0
             return input_
+
+    def _update_deadline(self, time: int, delay: float) -> None:
+        """
+        .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
+            and calling them may cause **unexpected behaviour**. Please refrain from using them.
+
+        Set :attr:`_next_deadline` to *delay* milliseconds after *time*
+        if that comes before the current one. Nothing is set if *delay* is too long
+        to be tracked by the ticks, for example if it is infinite.
+
+        :param int time: The time (in milliseconds, tracked by :meth:`supervisor.ticks_ms`)
+            from which *delay* is counted.
+        :param float delay: The time (in milliseconds) after *time* at which a button
+            could begin being held down or end a multi-press.
+        """
+        if not delay < _TICKS_HALFPERIOD:  # Too long to track, e.g. inf
+            return
+        deadline = (time + int(max(delay, 0))) & _TICKS_MAX
+        next_deadline = self._next_deadline
+        if next_deadline is None or (deadline - next_deadline) & _TICKS_MAX >= _TICKS_HALFPERIOD:
+            self._next_deadline = deadline
+
+    def _multi_press_input(self, button_number: int, press_count: int) -> ButtonInput:
+        """
+        .. caution:: Methods with a *leading underscore (_)* are meant for **internal use only**,
+            and calling them may cause **unexpected behaviour**. Please refrain from using them.
+
+        Return the :class:`ButtonInput` stored in :attr:`_multi_press_inputs` for a multi-press,
+        creating it if the multi-press has more presses than any previous one.
+
+        :param int button_number: The number of the button that performed the multi-press.
+        :param int press_count: The amount of times the button was pressed in the multi-press.
+        :return: The :class:`ButtonInput` representing the multi-press.
+        :rtype: ButtonInput
+        """
+        inputs = self._multi_press_inputs[button_number]
+        while len(inputs) < press_count:  # Button.max_multi_press was increased
+            inputs.append(ButtonInput(len(inputs) + 1, button_number))
+        return inputs[press_count - 1]
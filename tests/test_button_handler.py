@@ -122,21 +122,21 @@ class TestButton:
         assert button.button_number == button._button_number
         assert button.is_holding == button._is_holding
         assert button.is_pressed == button._is_pressed
+        assert button._last_press_time == None
+        assert button._press_count == 0
 
         with pytest.raises(ValueError):
             button = Button(-1)
 
-    def test__check_multi_press_timeout(self, time, button: Button):
-        assert button._check_multi_press_timeout(time) == None
-        button._press_count += 2
-        button._last_press_time = time - button.multi_press_interval * 2
-        assert button._check_multi_press_timeout(time) == 2
-
-    def test__is_held(self, time, button: Button):
-        button._is_pressed = True
-        assert button._is_held(time + 250) == False
+    def test_non_integer_times(self, time):
+        button = Button(
+            config=ButtonInitConfig(multi_press_interval=175.5, long_press_threshold=1000.5)
+        )
+        button._press_count = 1
         button._press_start_time = time - button.long_press_threshold * 2
-        assert button._is_held(time) == True
+        button._last_press_time = time - button.multi_press_interval * 2
+        assert button._press_start_time == int(time - button.long_press_threshold * 2)
+        assert button._last_press_time == int(time - button.multi_press_interval * 2)
 
 
 class TestButtonInput:
@@ -178,6 +178,10 @@ class TestButtonInput:
 
         assert str(input_) == f"{ButtonInput.SHORT_PRESS} on button 3"
 
+        input_.action = ButtonInput.HOLD
+        input_.button_number = 1
+        assert hash(input_) == hash((ButtonInput.HOLD, 1))
+
 
 class TestButtonHandler:
     def sim_press(self, button: Button, handler: ButtonHandler, press, press_count=1):
@@ -199,6 +203,8 @@ class TestButtonHandler:
         assert input_ in button_handler.callable_inputs
         assert len(button_handler.buttons) == 4
         assert button_handler.buttons[1].max_multi_press == config.max_multi_press
+        assert button_handler.buttons[3]._states is button_handler._states
+        assert button_handler.buttons[3]._index == 3
 
     @pytest.mark.parametrize("amount", {0, 1.2, -1})
     def test_invalid_button_amount(self, amount, event_queue):
@@ -213,20 +219,32 @@ class TestButtonHandler:
         assert call_amount == 2
 
     def test__handle_buttons(self, button_handler: ButtonHandler, time):
-        inputs = button_handler._handle_buttons()
-        assert inputs == set()
+        inputs = button_handler._handle_buttons(time)
+        assert inputs == ()
 
         button = button_handler.buttons[2]
         button._is_pressed = True
+        button._press_start_time = time
+        assert button_handler._handle_buttons(time) == ()
         button._press_start_time = time - button.long_press_threshold * 2
-        inputs = button_handler._handle_buttons()
-        assert inputs == {ButtonInput(ButtonInput.HOLD, 2)}
+        inputs = button_handler._handle_buttons(time)
+        assert inputs == (ButtonInput(ButtonInput.HOLD, 2),)
+        assert button.is_holding
+        assert button_handler._handle_buttons(time) == ()
 
         button = button_handler.buttons[3]
         button._press_count = 3
+        button._last_press_time = time
+        assert button_handler._handle_buttons(time) == ()
         button._last_press_time = time - button.multi_press_interval * 2
-        inputs = button_handler._handle_buttons()
-        assert inputs == {ButtonInput(3, 3)}
+        inputs = button_handler._handle_buttons(time)
+        assert inputs == (ButtonInput(3, 3),)
+        assert button_handler._next_deadline == None
+
+        button._is_pressed = True
+        button._press_start_time = time
+        button_handler._handle_buttons(time)
+        assert button_handler._next_deadline == time + button.long_press_threshold
 
     def test__handle_event(self, time, button_handler: ButtonHandler):
         button = button_handler.buttons[1]
@@ -257,30 +275,91 @@ class TestButtonHandler:
         assert button._last_press_time == None
         assert button._press_count == 0
 
+    def test__multi_press_input(self, button_handler: ButtonHandler):
+        input_ = button_handler._multi_press_input(2, 3)
+        assert input_ == ButtonInput(3, 2)
+        assert button_handler._multi_press_input(2, 3) is input_
+        assert button_handler._multi_press_input(2, 1) is button_handler._short_press_inputs[2]
+
+    def test_update_repeated_input(self, button_handler: ButtonHandler, time):
+        queue: MockEventQueue = button_handler._event_queue
+        for timestamp in (time, time + 10, time + 100, time + 110):
+            queue.keypad_eventqueue_record(1, timestamp in {time, time + 100}, timestamp)
+        inputs = button_handler.update()
+        assert inputs == (ButtonInput(ButtonInput.SHORT_PRESS, 1),) * 2
+        assert inputs[0] is button_handler._short_press_inputs[1]
+        assert inputs[1] is not inputs[0]
+        assert inputs[0].timestamp == time + 10
+        assert inputs[1].timestamp == time + 110
+
     def test_update(self, button_handler: ButtonHandler, time):
         queue: MockEventQueue = button_handler._event_queue
         button = button_handler.buttons[2]
 
+        # No active buttons and no events
+        assert button_handler.update() == ()
+
         # Incomplete multi press + timeout
-        assert self.sim_press(button, button_handler, "SHORT_PRESS") == set()
-        input_set = button_handler.update()
-        assert input_set == set()
-        while input_set == set() and timestamp_diff(ticks_ms(), time) < 100:
-            input_set = button_handler.update()
-        assert input_set.pop() == ButtonInput(ButtonInput.SHORT_PRESS, 2)
+        assert self.sim_press(button, button_handler, "SHORT_PRESS") == ()
+        inputs = button_handler.update()
+        assert inputs == ()
+        while not inputs and timestamp_diff(ticks_ms(), time) < 100:
+            inputs = button_handler.update()
+        assert inputs == (ButtonInput(ButtonInput.SHORT_PRESS, 2),)
 
         # Multi press disabled
         button = button_handler.buttons[1]
-        assert self.sim_press(button, button_handler, "SHORT_PRESS", 4) == set()
-        assert button_handler.update().pop() == ButtonInput(ButtonInput.SHORT_PRESS, 1)
+        assert self.sim_press(button, button_handler, "SHORT_PRESS", 4) == ()
+        assert button_handler.update() == (ButtonInput(ButtonInput.SHORT_PRESS, 1),)
 
         # Finish max multi press
         self.sim_press(button, button_handler, "SHORT_PRESS")
         button._press_count = 4
         button.enable_multi_press = True
-        assert button_handler.update().pop() == ButtonInput(4, 1)
+        assert button_handler.update() == (ButtonInput(4, 1),)
 
         # Long press
         button._press_start_time = time - button.long_press_threshold * 2
         queue.keypad_eventqueue_record(1, False, time)
-        assert button_handler.update().pop() == ButtonInput(ButtonInput.LONG_PRESS, 1)
+        assert button_handler.update() == (ButtonInput(ButtonInput.LONG_PRESS, 1),)
+        button_handler._handle_buttons(ticks_ms())
+        assert button_handler._next_deadline == None
+
+    def test_update_timing_changed(self, button_handler: ButtonHandler):
+        queue: MockEventQueue = button_handler._event_queue
+        button = button_handler.buttons[0]
+        time = ticks_ms()
+
+        # Long press threshold lowered while a press is pending
+        queue.keypad_eventqueue_record(0, True, time)
+        assert button_handler.update() == ()
+        button.long_press_threshold = 0
+        assert button_handler._states.timing_changed
+        assert button_handler.update() == (ButtonInput(ButtonInput.HOLD, 0),)
+        assert not button_handler._states.timing_changed
+
+        # Multi-press interval lowered while a multi-press is pending
+        button = button_handler.buttons[3]
+        queue.keypad_eventqueue_record(3, True, time)
+        queue.keypad_eventqueue_record(3, False, time)
+        assert button_handler.update() == ()
+        button.multi_press_interval = -1
+        assert button_handler.update() == (ButtonInput(ButtonInput.SHORT_PRESS, 3),)
+
+    def test_update_infinite_thresholds(self, event_queue: MockEventQueue, time):
+        config = ButtonInitConfig(
+            multi_press_interval=float("inf"), long_press_threshold=float("inf")
+        )
+        button_handler = ButtonHandler(event_queue, set(), config={0: config})
+
+        event_queue.keypad_eventqueue_record(0, True, time)
+        assert button_handler.update() == ()
+        assert button_handler._next_deadline == None
+        event_queue.keypad_eventqueue_record(0, False, time + 5000)
+        assert button_handler.update() == ()
+        assert button_handler._next_deadline == None
+        assert button_handler._handle_buttons(time + 10000) == ()
+        assert button_handler._next_deadline == None
+
+        button_handler._update_deadline(time, float("nan"))
+        assert button_handler._next_deadline == None